@@ -2,10 +2,12 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import time
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from streamlit_autorefresh import st_autorefresh
 import io
+import re
+from pathlib import Path
 
 # Configure the page
 st.set_page_config(
@@ -15,262 +17,259 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def load_css():
+    """Read the custom stylesheet once per server process"""
+    return (Path(__file__).parent / 'style.css').read_text()
+
 # Custom CSS for enhanced styling
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 1rem;
-        background: linear-gradient(90deg, #1f77b4, #2ecc71);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-weight: bold;
-    }
-    .aircraft-card {
-        background: white;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border-left: 5px solid #3498db;
-    }
-    .critical-card {
-        border-left: 5px solid #e74c3c;
-        background: linear-gradient(135deg, #ffebee, #ffffff);
-    }
-    .warning-card {
-        border-left: 5px solid #f39c12;
-        background: linear-gradient(135deg, #fff3e0, #ffffff);
-    }
-    .crew-bar {
-        margin: 0.5rem 0;
-        padding: 0.5rem;
-        border-radius: 5px;
-    }
-    .ca-bar { background-color: #e3f2fd; }
-    .fo-bar { background-color: #e8f5e8; }
-    .cabin-bar { background-color: #fff3e0; }
-    .progress-container {
-        background: #ecf0f1;
-        border-radius: 10px;
-        height: 25px;
-        margin: 0.2rem 0;
-        position: relative;
-        overflow: hidden;
-    }
-    .progress-fill {
-        height: 100%;
-        border-radius: 10px;
-        transition: width 0.5s ease-in-out;
-        position: relative;
-    }
-    .progress-text {
-        position: absolute;
-        top: 50%;
-        left: 50%;
-        transform: translate(-50%, -50%);
-        font-weight: bold;
-        font-size: 0.8rem;
-        color: #2c3e50;
-        text-shadow: 1px 1px 2px white;
-    }
-    .tail-number {
-        font-size: 1.2rem;
-        font-weight: bold;
-        color: #2c3e50;
-        margin-bottom: 0.5rem;
-    }
-    .crew-label {
-        font-size: 0.9rem;
-        font-weight: bold;
-        margin-bottom: 0.2rem;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+
+CREW_TYPES = ('CA', 'FO', 'Cabin')
+
+# Display name, emoji and bar class for each crew type
+CREW_LABELS = {
+    'CA': ('Captain', '👨‍✈️', 'ca-bar'),
+    'FO': ('First Officer', '👩‍✈️', 'fo-bar'),
+    'Cabin': ('Cabin Crew', '👨‍💼', 'cabin-bar')
+}
+
+PROGRESS_BAR_TEMPLATE = """
+    <div class="crew-bar {crew_class}">
+        <div class="crew-label">
+            {emoji} {name} - {label}
+        </div>
+        <div class="progress-container">
+            <div class="progress-fill" style="width: {progress_percent}%; background-color: {color};">
+                <div class="progress-text">
+                    {elapsed_hhmm} / {max_hhmm} (Remaining: {remaining_hhmm})
+                </div>
+            </div>
+        </div>
+    </div>
+    """
+
+# Bar fill for each crew type in the fleet chart
+CREW_CHART_COLORS = {
+    'CA': "#3498db",  # Blue
+    'FO': "#9b59b6",  # Purple
+    'Cabin': "#95a5a6"  # Grey
+}
+
+# Card class and emoji for each overall aircraft status
+CARD_STYLES = {
+    'critical': ('critical-card', '🚨'),
+    'warning': ('warning-card', '⚠️'),
+    'ok': ('aircraft-card', '✅')
+}
+
+CARD_TEMPLATE = """
+    <div class="{card_class}">
+        <div class="tail-number">
+            {status_emoji} {tail_number} - {remaining_hhmm} remaining
+        </div>
+        {progress_bars}
+    </div>
+    """
+
+# Fleet size above which the dashboard shows one chart instead of cards
+CHART_FLEET_SIZE = 50
+
+# Remaining-minute thresholds: 1 hour or less is critical, 2 hours or less is a warning
+STATUS_THRESHOLDS = np.array([60, 120], dtype=np.int32)
+STATUS_DTYPE = pd.CategoricalDtype(['ok', 'warning', 'critical'], ordered=True)
+STATUS_COLORS = np.array([
+    "#2ecc71",  # Green
+    "#f39c12",  # Orange
+    "#e74c3c"  # Red
+])
+
+# Check-in times and durations are stored as one int32 minutes column per crew field
+MINUTE_COLUMN_DTYPES = {
+    f'{crew_type} {field}': np.int32
+    for crew_type in CREW_TYPES
+    for field in ('Check-in (min)', 'Max FDP (min)', 'Elapsed FDP (min)')
+}
+
+# Valid 24-hour HHMM entry (0000-2359)
+HHMM_PATTERN = re.compile(r'([01][0-9]|2[0-3])[0-5][0-9]')
+
+# FDP limit in hours by check-in hour: [1-2 segments, 3+ segments]
+FDP_LIMITS_BY_HOUR = np.array(
+    [[11, 10]] * 5 +   # 0000-0459
+    [[14, 13]] * 3 +   # 0500-0759
+    [[13, 12]] * 5 +   # 0800-1259
+    [[12, 11]] * 4 +   # 1300-1659
+    [[11, 10]] * 7,    # 1700-2359
+    dtype=np.int8
+)
 
 def hhmm_to_minutes(hhmm):
-    """Convert HHMM format to total minutes"""
-    if pd.isna(hhmm) or hhmm == '' or hhmm is None:
-        return 0
-    try:
-        hhmm_str = str(int(float(hhmm))).zfill(4)
-        hours = int(hhmm_str[:2])
-        minutes = int(hhmm_str[2:])
-        if hours < 0 or hours > 23 or minutes < 0 or minutes > 59:
-            return 0
-        return hours * 60 + minutes
-    except (ValueError, TypeError):
-        return 0
+    """Convert an array of HHMM values to total minutes (invalid entries become 0)"""
+    values = pd.to_numeric(pd.Series(hhmm), errors='coerce').fillna(0).astype(np.int32).to_numpy()
+    hours, minutes = np.divmod(values, 100)
+    valid = (hours >= 0) & (hours <= 23) & (minutes >= 0) & (minutes <= 59)
+    return np.where(valid, hours * 60 + minutes, 0).astype(np.int32)
 
 def minutes_to_hhmm(total_minutes):
-    """Convert minutes to HHMM format"""
+    """Convert a duration in minutes to HHMM format"""
     if total_minutes <= 0:
         return "0000"
     total_minutes = int(total_minutes)
     hours = total_minutes // 60
     minutes = total_minutes % 60
-    hours = hours % 24 if hours >= 24 else hours
     return f"{hours:02d}{minutes:02d}"
 
 def calculate_fdp_limits(start_time_hhmm, segments=1):
     """Calculate FDP limits based on start time and segments per FAA Part 117"""
-    try:
-        hours = int(str(start_time_hhmm).zfill(4)[:2])
-        if 500 <= hours <= 759:
-            return 14 if segments <= 2 else 13
-        elif 800 <= hours <= 1259:
-            return 13 if segments <= 2 else 12
-        elif 1300 <= hours <= 1659:
-            return 12 if segments <= 2 else 11
-        else:
-            return 11 if segments <= 2 else 10
-    except:
-        return 9
+    hours = int(start_time_hhmm) // 100
+    return int(FDP_LIMITS_BY_HOUR[hours, 0 if segments <= 2 else 1])
 
-def calculate_progress_data(row, crew_type):
-    """Calculate progress bar data for each crew type"""
-    try:
-        if crew_type == 'CA':
-            max_time = row['CA Max FDP (hours)']
-            elapsed = row['CA Elapsed FDP (HHMM)']
-        elif crew_type == 'FO':
-            max_time = row['FO Max FDP (hours)']
-            elapsed = row['FO Elapsed FDP (HHMM)']
-        else:  # Cabin
-            max_time = row['Cabin Max FDP (hours)']
-            elapsed = row['Cabin Elapsed FDP (HHMM)']
-        
-        max_minutes = max_time * 60
-        elapsed_minutes = hhmm_to_minutes(elapsed)
-        
-        remaining_minutes = max(0, max_minutes - elapsed_minutes)
-        progress_percent = min(100, (elapsed_minutes / max_minutes) * 100) if max_minutes > 0 else 0
+def classify_remaining(remaining_min):
+    """Classify remaining minutes into int8 status codes (0 ok, 1 warning, 2 critical)"""
+    return (len(STATUS_THRESHOLDS) - np.searchsorted(STATUS_THRESHOLDS, remaining_min)).astype(np.int8)
+
+@st.cache_data(max_entries=4)
+def compute_progress_frame(df):
+    """Calculate elapsed, max and remaining minutes, percent and status for every crew type in one vectorized pass"""
+    progress = pd.DataFrame({'Tail Number': df['Tail Number'].to_numpy()})
+    for crew_type in CREW_TYPES:
+        elapsed_min = df[f'{crew_type} Elapsed FDP (min)'].to_numpy()
+        max_min = df[f'{crew_type} Max FDP (min)'].to_numpy()
+        remaining_min = np.maximum(0, max_min - elapsed_min)
+        percent = np.divide(elapsed_min, max_min, out=np.zeros(len(df)), where=max_min > 0) * 100
         
-        # Determine color based on remaining time
-        if remaining_minutes <= 60:  # 1 hour or less
-            color = "#e74c3c"  # Red
-            status = "critical"
-        elif remaining_minutes <= 120:  # 2 hours or less
-            color = "#f39c12"  # Orange
-            status = "warning"
-        else:
-            color = "#2ecc71"  # Green
-            status = "ok"
+        # Determine status and color based on remaining time
+        status_codes = classify_remaining(remaining_min)
         
-        return {
-            'progress_percent': progress_percent,
-            'remaining_hhmm': minutes_to_hhmm(remaining_minutes),
-            'elapsed_hhmm': elapsed,
-            'max_hhmm': minutes_to_hhmm(max_minutes),
-            'color': color,
-            'status': status
-        }
-    except Exception as e:
-        return {
-            'progress_percent': 0,
-            'remaining_hhmm': "0000",
-            'elapsed_hhmm': "0000",
-            'max_hhmm': "0000",
-            'color': "#95a5a6",
-            'status': 'error'
-        }
+        progress[f'{crew_type}_elapsed_min'] = elapsed_min
+        progress[f'{crew_type}_max_min'] = max_min
+        progress[f'{crew_type}_remaining_min'] = remaining_min
+        progress[f'{crew_type}_percent'] = np.minimum(100, percent)
+        progress[f'{crew_type}_status'] = pd.Categorical.from_codes(status_codes, dtype=STATUS_DTYPE)
+        progress[f'{crew_type}_color'] = STATUS_COLORS[status_codes]
+    
+    # Overall aircraft status is the most severe crew status
+    status_codes = np.maximum.reduce([progress[f'{crew_type}_status'].cat.codes for crew_type in CREW_TYPES])
+    progress['Status'] = pd.Categorical.from_codes(status_codes, dtype=STATUS_DTYPE)
+    return progress
+
+def calculate_progress_data(progress_row, crew_type):
+    """Build progress bar data for a crew type from a row of the progress frame"""
+    return {
+        'progress_percent': progress_row[f'{crew_type}_percent'],
+        'remaining_hhmm': minutes_to_hhmm(progress_row[f'{crew_type}_remaining_min']),
+        'elapsed_hhmm': minutes_to_hhmm(progress_row[f'{crew_type}_elapsed_min']),
+        'max_hhmm': minutes_to_hhmm(progress_row[f'{crew_type}_max_min']),
+        'color': progress_row[f'{crew_type}_color'],
+        'status': progress_row[f'{crew_type}_status']
+    }
 
 def create_progress_bar(progress_data, crew_type, label):
     """Create a visual progress bar for a crew member"""
-    crew_labels = {
-        'CA': {'name': 'Captain', 'emoji': '👨‍✈️', 'class': 'ca-bar'},
-        'FO': {'name': 'First Officer', 'emoji': '👩‍✈️', 'class': 'fo-bar'},
-        'Cabin': {'name': 'Cabin Crew', 'emoji': '👨‍💼', 'class': 'cabin-bar'}
-    }
-    
-    crew_info = crew_labels.get(crew_type, {'name': crew_type, 'emoji': '👤', 'class': ''})
-    
-    return f"""
-    <div class="crew-bar {crew_info['class']}">
-        <div class="crew-label">
-            {crew_info['emoji']} {crew_info['name']} - {label}
-        </div>
-        <div class="progress-container">
-            <div class="progress-fill" style="width: {progress_data['progress_percent']}%; background-color: {progress_data['color']};">
-                <div class="progress-text">
-                    {progress_data['elapsed_hhmm']} / {progress_data['max_hhmm']} (Remaining: {progress_data['remaining_hhmm']})
-                </div>
-            </div>
-        </div>
-    </div>
-    """
+    name, emoji, crew_class = CREW_LABELS.get(crew_type, (crew_type, '👤', ''))
+    return PROGRESS_BAR_TEMPLATE.format(name=name, emoji=emoji, crew_class=crew_class, label=label, **progress_data)
 
-def create_aircraft_card(tail_number, aircraft_data):
+def create_aircraft_card(tail_number, aircraft_data, status):
     """Create a visual card for an aircraft with progress bars"""
-    # Calculate overall status
-    statuses = [data['status'] for data in aircraft_data.values()]
-    if 'critical' in statuses:
-        card_class = 'critical-card'
-        status_emoji = '🚨'
-    elif 'warning' in statuses:
-        card_class = 'warning-card'
-        status_emoji = '⚠️'
-    else:
-        card_class = 'aircraft-card'
-        status_emoji = '✅'
+    card_class, status_emoji = CARD_STYLES[status]
     
     # Create progress bars HTML
-    progress_bars = ""
-    for crew_type, progress_data in aircraft_data.items():
-        progress_bars += create_progress_bar(progress_data, crew_type, progress_data['remaining_hhmm'])
+    progress_bars = "".join(
+        create_progress_bar(progress_data, crew_type, progress_data['remaining_hhmm'])
+        for crew_type, progress_data in aircraft_data.items()
+    )
     
-    return f"""
-    <div class="{card_class}">
-        <div class="tail-number">
-            {status_emoji} {tail_number} - {aircraft_data['CA']['remaining_hhmm']} remaining
-        </div>
-        {progress_bars}
-    </div>
-    """
+    return CARD_TEMPLATE.format(
+        card_class=card_class,
+        status_emoji=status_emoji,
+        tail_number=tail_number,
+        remaining_hhmm=aircraft_data['CA']['remaining_hhmm'],
+        progress_bars=progress_bars
+    )
+
+@st.cache_data(max_entries=2)
+def create_fleet_chart(progress):
+    """Create a single grouped bar chart of elapsed FDP for every aircraft and crew type"""
+    fig = go.Figure()
+    for crew_type in CREW_TYPES:
+        labels = [
+            f"{minutes_to_hhmm(elapsed)} / {minutes_to_hhmm(max_min)} (Remaining: {minutes_to_hhmm(remaining)})"
+            for elapsed, max_min, remaining in zip(
+                progress[f'{crew_type}_elapsed_min'],
+                progress[f'{crew_type}_max_min'],
+                progress[f'{crew_type}_remaining_min']
+            )
+        ]
+        fig.add_trace(go.Bar(
+            y=progress['Tail Number'],
+            x=progress[f'{crew_type}_elapsed_min'] / 60,
+            orientation='h',
+            name=CREW_LABELS[crew_type][0],
+            # Fill identifies the crew, outline shows its status
+            marker={
+                'color': CREW_CHART_COLORS[crew_type],
+                'line': {'color': progress[f'{crew_type}_color'], 'width': 3}
+            },
+            text=labels,
+            textposition='auto',
+            hovertemplate=f"%{{y}} {CREW_LABELS[crew_type][0]}<br>%{{text}}<extra></extra>"
+        ))
+    fig.update_layout(
+        barmode='group',
+        height=max(400, 60 * len(progress)),
+        xaxis_title="Elapsed FDP (hours)",
+        yaxis={'autorange': 'reversed'},
+        margin={'l': 0, 'r': 0, 't': 30, 'b': 0}
+    )
+    return fig
 
 def initialize_aircraft_data():
     """Initialize sample aircraft data"""
-    if 'aircraft_data' not in st.session_state:
-        st.session_state.aircraft_data = pd.DataFrame([
+    if 'fleet_rows' not in st.session_state:
+        st.session_state.fleet_rows = [
             {
                 'Tail Number': 'N123AA',
-                'CA Check-in': '0800',
-                'CA Max FDP (hours)': 13.0,
-                'CA Elapsed FDP (HHMM)': '0430',
-                'FO Check-in': '0800',
-                'FO Max FDP (hours)': 13.0,
-                'FO Elapsed FDP (HHMM)': '0430',
-                'Cabin Check-in': '0730',
-                'Cabin Max FDP (hours)': 14.0,
-                'Cabin Elapsed FDP (HHMM)': '0500'
+                'CA Check-in (min)': 480,
+                'CA Max FDP (min)': 780,
+                'CA Elapsed FDP (min)': 270,
+                'FO Check-in (min)': 480,
+                'FO Max FDP (min)': 780,
+                'FO Elapsed FDP (min)': 270,
+                'Cabin Check-in (min)': 450,
+                'Cabin Max FDP (min)': 840,
+                'Cabin Elapsed FDP (min)': 300
             },
             {
                 'Tail Number': 'N456BB',
-                'CA Check-in': '0600',
-                'CA Max FDP (hours)': 14.0,
-                'CA Elapsed FDP (HHMM)': '0830',
-                'FO Check-in': '0600',
-                'FO Max FDP (hours)': 14.0,
-                'FO Elapsed FDP (HHMM)': '0830',
-                'Cabin Check-in': '0530',
-                'Cabin Max FDP (hours)': 14.0,
-                'Cabin Elapsed FDP (HHMM)': '0900'
+                'CA Check-in (min)': 360,
+                'CA Max FDP (min)': 840,
+                'CA Elapsed FDP (min)': 510,
+                'FO Check-in (min)': 360,
+                'FO Max FDP (min)': 840,
+                'FO Elapsed FDP (min)': 510,
+                'Cabin Check-in (min)': 330,
+                'Cabin Max FDP (min)': 840,
+                'Cabin Elapsed FDP (min)': 540
             },
             {
                 'Tail Number': 'N789CC',
-                'CA Check-in': '1200',
-                'CA Max FDP (hours)': 12.0,
-                'CA Elapsed FDP (HHMM)': '0230',
-                'FO Check-in': '1200',
-                'FO Max FDP (hours)': 12.0,
-                'FO Elapsed FDP (HHMM)': '0230',
-                'Cabin Check-in': '1130',
-                'Cabin Max FDP (hours)': 13.0,
-                'Cabin Elapsed FDP (HHMM)': '0300'
+                'CA Check-in (min)': 720,
+                'CA Max FDP (min)': 720,
+                'CA Elapsed FDP (min)': 150,
+                'FO Check-in (min)': 720,
+                'FO Max FDP (min)': 720,
+                'FO Elapsed FDP (min)': 150,
+                'Cabin Check-in (min)': 690,
+                'Cabin Max FDP (min)': 780,
+                'Cabin Elapsed FDP (min)': 180
             }
-        ])
+        ]
+
+@st.cache_data(max_entries=4)
+def as_frame(rows):
+    """Build the fleet DataFrame from the session's row buffer"""
+    return pd.DataFrame(rows).astype(MINUTE_COLUMN_DTYPES)
 
 def main():
     # Header
@@ -310,46 +309,83 @@ def main():
                 cabin_elapsed = st.text_input("Cabin Elapsed", value="0000")
             
             if st.form_submit_button("➕ Add Aircraft", use_container_width=True):
-                if tail_number:
+                hhmm_inputs = {
+                    "CA Check-in": ca_checkin,
+                    "FO Check-in": fo_checkin,
+                    "Cabin Check-in": cabin_checkin,
+                    "CA Elapsed": ca_elapsed,
+                    "FO Elapsed": fo_elapsed,
+                    "Cabin Elapsed": cabin_elapsed
+                }
+                invalid_inputs = [label for label, value in hhmm_inputs.items() if not HHMM_PATTERN.fullmatch(value)]
+                
+                if invalid_inputs:
+                    st.error(f"Enter times as HHMM (0000-2359): {', '.join(invalid_inputs)}")
+                elif tail_number:
+                    # Convert HHMM entries to minutes once, at ingestion
+                    ca_checkin_min, fo_checkin_min, cabin_checkin_min = hhmm_to_minutes([ca_checkin, fo_checkin, cabin_checkin]).tolist()
+                    ca_elapsed_min, fo_elapsed_min, cabin_elapsed_min = hhmm_to_minutes([ca_elapsed, fo_elapsed, cabin_elapsed]).tolist()
                     new_aircraft = {
                         'Tail Number': tail_number,
-                        'CA Check-in': ca_checkin,
-                        'CA Max FDP (hours)': calculate_fdp_limits(ca_checkin, 2),
-                        'CA Elapsed FDP (HHMM)': ca_elapsed,
-                        'FO Check-in': fo_checkin,
-                        'FO Max FDP (hours)': calculate_fdp_limits(fo_checkin, 2),
-                        'FO Elapsed FDP (HHMM)': fo_elapsed,
-                        'Cabin Check-in': cabin_checkin,
-                        'Cabin Max FDP (hours)': calculate_fdp_limits(cabin_checkin, 2),
-                        'Cabin Elapsed FDP (HHMM)': cabin_elapsed
+                        'CA Check-in (min)': ca_checkin_min,
+                        'CA Max FDP (min)': calculate_fdp_limits(ca_checkin, 2) * 60,
+                        'CA Elapsed FDP (min)': ca_elapsed_min,
+                        'FO Check-in (min)': fo_checkin_min,
+                        'FO Max FDP (min)': calculate_fdp_limits(fo_checkin, 2) * 60,
+                        'FO Elapsed FDP (min)': fo_elapsed_min,
+                        'Cabin Check-in (min)': cabin_checkin_min,
+                        'Cabin Max FDP (min)': calculate_fdp_limits(cabin_checkin, 2) * 60,
+                        'Cabin Elapsed FDP (min)': cabin_elapsed_min
                     }
-                    st.session_state.aircraft_data = pd.concat([
-                        st.session_state.aircraft_data,
-                        pd.DataFrame([new_aircraft])
-                    ], ignore_index=True)
+                    st.session_state.fleet_rows.append(new_aircraft)
                     st.success(f"Added {tail_number} to tracking!")
-        
+    
+    # Nothing else to show until an aircraft is added
+    if not st.session_state.fleet_rows:
+        st.info("✈️ No aircraft being tracked. Use the sidebar to add aircraft.")
+        return
+    
+    with st.sidebar:
         st.markdown("---")
         st.header("📈 Statistics")
         
-        if not st.session_state.aircraft_data.empty:
-            total_aircraft = len(st.session_state.aircraft_data)
-            critical_count = 0
-            warning_count = 0
-            
-            for _, aircraft in st.session_state.aircraft_data.iterrows():
-                ca_data = calculate_progress_data(aircraft, 'CA')
-                fo_data = calculate_progress_data(aircraft, 'FO')
-                cabin_data = calculate_progress_data(aircraft, 'Cabin')
+        # Progress for the whole fleet, computed once and shared by every view below
+        progress = compute_progress_frame(as_frame(st.session_state.fleet_rows))
+        
+        # Large fleets are shown as a single chart instead of one card per aircraft
+        show_fleet_chart = len(progress) > CHART_FLEET_SIZE
+        
+        # Reuse the previous run's alerts and card HTML when fleet progress is unchanged
+        progress_hash = hash(pd.util.hash_pandas_object(progress, index=False).to_numpy().tobytes())
+        if st.session_state.get('progress_hash') != progress_hash:
+            # Single pass over the fleet collecting alerts and dashboard cards
+            critical_aircraft, warning_aircraft, aircraft_cards = [], [], []
+            for aircraft in progress.to_dict('records'):
+                tail_number = aircraft['Tail Number']
                 
-                if any(data['status'] == 'critical' for data in [ca_data, fo_data, cabin_data]):
-                    critical_count += 1
-                elif any(data['status'] == 'warning' for data in [ca_data, fo_data, cabin_data]):
-                    warning_count += 1
+                if aircraft['Status'] == 'critical':
+                    critical_aircraft.append(tail_number)
+                elif aircraft['Status'] == 'warning':
+                    warning_aircraft.append(tail_number)
+                
+                if show_fleet_chart:
+                    continue
+                
+                # Build progress data for each crew type
+                aircraft_progress = {
+                    crew_type: calculate_progress_data(aircraft, crew_type)
+                    for crew_type in CREW_TYPES
+                }
+                aircraft_cards.append(create_aircraft_card(tail_number, aircraft_progress, aircraft['Status']))
             
-            st.metric("Total Aircraft", total_aircraft)
-            st.metric("Critical Alerts", critical_count, delta_color="inverse")
-            st.metric("Warnings", warning_count)
+            st.session_state.fleet_view = (critical_aircraft, warning_aircraft, "\n".join(aircraft_cards))
+            st.session_state.progress_hash = progress_hash
+        
+        critical_aircraft, warning_aircraft, cards_html = st.session_state.fleet_view
+        
+        st.metric("Total Aircraft", len(progress))
+        st.metric("Critical Alerts", len(critical_aircraft), delta_color="inverse")
+        st.metric("Warnings", len(warning_aircraft))
     
     # Main content area
     col1, col2 = st.columns([2, 1])
@@ -357,60 +393,26 @@ def main():
     with col1:
         st.header("🛩️ Aircraft Status Dashboard")
         
-        if not st.session_state.aircraft_data.empty:
-            # Create visual cards for each aircraft
-            for _, aircraft in st.session_state.aircraft_data.iterrows():
-                tail_number = aircraft['Tail Number']
-                
-                # Calculate progress data for each crew type
-                ca_data = calculate_progress_data(aircraft, 'CA')
-                fo_data = calculate_progress_data(aircraft, 'FO')
-                cabin_data = calculate_progress_data(aircraft, 'Cabin')
-                
-                aircraft_progress = {
-                    'CA': ca_data,
-                    'FO': fo_data,
-                    'Cabin': cabin_data
-                }
-                
-                # Create and display the aircraft card
-                card_html = create_aircraft_card(tail_number, aircraft_progress)
-                st.markdown(card_html, unsafe_allow_html=True)
-        
+        if show_fleet_chart:
+            st.plotly_chart(create_fleet_chart(progress), use_container_width=True)
         else:
-            st.info("✈️ No aircraft being tracked. Use the sidebar to add aircraft.")
+            # Display all aircraft cards in a single block
+            st.markdown(cards_html, unsafe_allow_html=True)
     
     with col2:
         st.header("🚨 Alert Summary")
         
-        if not st.session_state.aircraft_data.empty:
-            critical_aircraft = []
-            warning_aircraft = []
-            
-            for _, aircraft in st.session_state.aircraft_data.iterrows():
-                tail_number = aircraft['Tail Number']
-                ca_data = calculate_progress_data(aircraft, 'CA')
-                fo_data = calculate_progress_data(aircraft, 'FO')
-                cabin_data = calculate_progress_data(aircraft, 'Cabin')
-                
-                if any(data['status'] == 'critical' for data in [ca_data, fo_data, cabin_data]):
-                    critical_aircraft.append(tail_number)
-                elif any(data['status'] == 'warning' for data in [ca_data, fo_data, cabin_data]):
-                    warning_aircraft.append(tail_number)
-            
-            if critical_aircraft:
-                st.error("### 🚨 CRITICAL ALERTS")
-                for aircraft in critical_aircraft:
-                    st.write(f"• {aircraft} - Immediate action required")
-            
-            if warning_aircraft:
-                st.warning("### ⚠️ WARNINGS")
-                for aircraft in warning_aircraft:
-                    st.write(f"• {aircraft} - Monitor closely")
-            
-            if not critical_aircraft and not warning_aircraft:
-                st.success("### ✅ ALL SYSTEMS NORMAL")
-                st.write("All aircraft within safe limits")
+        if critical_aircraft:
+            st.error("### 🚨 CRITICAL ALERTS")
+            st.markdown("\n\n".join(f"• {aircraft} - Immediate action required" for aircraft in critical_aircraft))
+        
+        if warning_aircraft:
+            st.warning("### ⚠️ WARNINGS")
+            st.markdown("\n\n".join(f"• {aircraft} - Monitor closely" for aircraft in warning_aircraft))
+        
+        if not critical_aircraft and not warning_aircraft:
+            st.success("### ✅ ALL SYSTEMS NORMAL")
+            st.write("All aircraft within safe limits")
         
         st.markdown("---")
         st.header("🕒 Last Updated")
@@ -418,20 +420,18 @@ def main():
         
         # Simulate time progression for demo
         if st.button("⏩ Simulate +30min", use_container_width=True):
-            for idx, aircraft in st.session_state.aircraft_data.iterrows():
-                # Add 30 minutes to elapsed times
-                for col in ['CA Elapsed FDP (HHMM)', 'FO Elapsed FDP (HHMM)', 'Cabin Elapsed FDP (HHMM)']:
-                    current = aircraft[col]
-                    if current != '0000':
-                        current_minutes = hhmm_to_minutes(current)
-                        new_minutes = current_minutes + 30
-                        st.session_state.aircraft_data.at[idx, col] = minutes_to_hhmm(new_minutes)
+            # Add 30 minutes to elapsed times of crews already on duty, one column at a time
+            fleet = as_frame(st.session_state.fleet_rows)
+            for crew_type in CREW_TYPES:
+                col = f'{crew_type} Elapsed FDP (min)'
+                elapsed = fleet[col].to_numpy()
+                fleet[col] = np.where(elapsed > 0, elapsed + 30, elapsed)
+            st.session_state.fleet_rows = fleet.to_dict('records')
             st.rerun()
     
-    # Auto-refresh logic
+    # Auto-refresh logic (client-side timer, keeps the server free between runs)
     if auto_refresh:
-        time.sleep(refresh_rate)
-        st.rerun()
+        st_autorefresh(interval=refresh_rate * 1000, key="fdp_refresh")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file